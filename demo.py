@@ -3,10 +3,17 @@ Demo Script - Virtual Memory Simulator
 Demonstrates different page replacement algorithms and generates performance comparison
 """
 
-import random
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import shared_memory
+
+import matplotlib
+matplotlib.use('Agg')  # Plots are only saved to files, never shown
 import matplotlib.pyplot as plt
 import numpy as np
 from virtual_memory import VirtualMemorySimulator
+from replacement_algorithms import ReferenceTrace
 
 
 def generate_reference_string(length, num_pages, pattern='random'):
@@ -20,67 +27,133 @@ def generate_reference_string(length, num_pages, pattern='random'):
     - loop: Repeated loop pattern
     """
     if pattern == 'random':
-        return [random.randint(0, num_pages - 1) for _ in range(length)]
+        return np.random.randint(0, num_pages, size=length).tolist()
     
     elif pattern == 'sequential':
-        refs = []
-        for _ in range(length // num_pages + 1):
-            refs.extend(range(num_pages))
-        return refs[:length]
+        return np.tile(np.arange(num_pages), length // num_pages + 1)[:length].tolist()
     
     elif pattern == 'locality':
         # 80% accesses to 20% of pages (locality of reference)
-        refs = []
-        hot_pages = random.sample(range(num_pages), num_pages // 5)
-        
-        for _ in range(length):
-            if random.random() < 0.8:
-                refs.append(random.choice(hot_pages))
-            else:
-                refs.append(random.randint(0, num_pages - 1))
-        return refs
+        hot_pages = np.random.choice(num_pages, size=num_pages // 5, replace=False)
+        is_hot = np.random.rand(length) < 0.8
+        hot_picks = np.random.choice(hot_pages, size=length)
+        cold_picks = np.random.randint(0, num_pages, size=length)
+        return np.where(is_hot, hot_picks, cold_picks).tolist()
     
     elif pattern == 'loop':
         # Simulate loop accessing small working set
-        working_set = random.sample(range(num_pages), min(10, num_pages))
-        refs = []
-        for _ in range(length // len(working_set) + 1):
-            refs.extend(working_set)
-        return refs[:length]
+        working_set = np.random.choice(num_pages, size=min(10, num_pages), replace=False)
+        return np.tile(working_set, length // len(working_set) + 1)[:length].tolist()
     
     else:
         raise ValueError(f"Unknown pattern: {pattern}")
 
 
-def compare_algorithms(reference_string, num_frames_list, num_pages, page_size=4096, tlb_size=16):
-    """Compare all algorithms across different frame counts"""
+# Row order of the result matrix returned by compare_algorithms
+ALGORITHMS = ['FIFO', 'LRU', 'LFU', 'Optimal', 'Clock']
+
+# Below this many simulated references (trace length x frame counts),
+# compare_algorithms runs in-process; starting workers would cost more
+SERIAL_REFERENCES = 200_000
+
+# Reference string shared with compare_algorithms' worker processes
+_shared_memory = None
+_shared_refs = None
+
+
+def _attach_shm(name, length):
+    """Worker initializer: view the shared reference string without copying it"""
+    global _shared_memory, _shared_refs
+    _shared_memory = shared_memory.SharedMemory(name=name)
+    _shared_refs = np.ndarray(length, dtype=np.int64, buffer=_shared_memory.buf)
+
+
+def _run_algorithm(alg, num_frames_list, num_pages, page_size, tlb_size, refs=None):
+    """
+    Run one algorithm on the reference string at every frame count
+    
+    refs defaults to the worker's shared reference string.
+    Returns: (page_faults, page_fault_rate) per frame count, or an error message
+    """
+    if refs is None:
+        refs = _shared_refs
     
-    algorithms = ['FIFO', 'LRU', 'LFU', 'Optimal', 'Clock']
-    results = {alg: [] for alg in algorithms}
+    # Preprocess the reference string once for every run below
+    trace = ReferenceTrace.from_sequence(refs) if alg == 'Optimal' else None
+    sim = None
+    runs = []
     
     for num_frames in num_frames_list:
-        print(f"\nTesting with {num_frames} frames...")
-        
-        for alg in algorithms:
-            try:
+        try:
+            if sim is None:
                 sim = VirtualMemorySimulator(
                     num_pages=num_pages,
                     num_frames=num_frames,
                     page_size=page_size,
                     tlb_size=tlb_size,
                     algorithm_name=alg,
-                    reference_string=reference_string if alg == 'Optimal' else None
+                    reference_string=trace
                 )
-                
-                sim.run_trace(reference_string)
-                stats = sim.get_statistics()
-                results[alg].append(stats['page_fault_rate'])
-                
-                print(f"  {alg:8s}: {stats['page_faults']} page faults ({stats['page_fault_rate']:.2f}%)")
-                
-            except Exception as e:
-                print(f"  {alg:8s}: Error - {e}")
-                results[alg].append(None)
+            else:
+                sim.reset(num_frames, alg, trace)
+            
+            sim.run_trace(refs)
+            stats = sim.get_statistics()
+            runs.append((stats['page_faults'], stats['page_fault_rate']))
+            
+        except Exception as e:
+            runs.append(f"Error - {e}")
+    
+    return runs
+
+
+def compare_algorithms(reference_string, num_frames_list, num_pages, page_size=4096, tlb_size=16):
+    """
+    Compare all algorithms across different frame counts
+    
+    Each algorithm runs in its own worker process; the reference string is
+    placed in shared memory once rather than pickled to every worker. With
+    a single CPU or a small workload everything runs in-process instead.
+    
+    Returns: page fault rates as an array of shape
+             (len(ALGORITHMS), len(num_frames_list)), NaN where a run failed
+    """
+    
+    results = np.full((len(ALGORITHMS), len(num_frames_list)), np.nan)
+    
+    refs = np.ascontiguousarray(reference_string, dtype=np.int64)
+    workers = min(len(ALGORITHMS), os.cpu_count() or 1)
+    
+    if workers == 1 or len(refs) * len(num_frames_list) < SERIAL_REFERENCES:
+        runs = [_run_algorithm(alg, num_frames_list, num_pages, page_size, tlb_size, refs)
+                for alg in ALGORITHMS]
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=max(refs.nbytes, 1))
+        try:
+            shared = np.ndarray(len(refs), dtype=np.int64, buffer=shm.buf)
+            shared[:] = refs
+            del shared  # Release the buffer so shm can be closed
+            
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shm,
+                                     initargs=(shm.name, len(refs))) as pool:
+                runs = list(pool.map(_run_algorithm, ALGORITHMS, repeat(num_frames_list),
+                                     repeat(num_pages), repeat(page_size), repeat(tlb_size)))
+        finally:
+            shm.close()
+            shm.unlink()
+    
+    for f_idx, num_frames in enumerate(num_frames_list):
+        print(f"\nTesting with {num_frames} frames...")
+        
+        for a_idx, alg in enumerate(ALGORITHMS):
+            run = runs[a_idx][f_idx]
+            if isinstance(run, str):
+                print(f"  {alg:8s}: {run}")
+                continue
+            
+            page_faults, page_fault_rate = run
+            results[a_idx, f_idx] = page_fault_rate
+            print(f"  {alg:8s}: {page_faults} page faults ({page_fault_rate:.2f}%)")
     
     return results
 
@@ -88,25 +161,25 @@ def compare_algorithms(reference_string, num_frames_list, num_pages, page_size=4
 def plot_comparison(results, num_frames_list, pattern_name):
     """Create visualization of algorithm comparison"""
     
-    plt.figure(figsize=(12, 6))
+    fig, ax = plt.subplots(figsize=(12, 6))
     
-    for alg, fault_rates in results.items():
-        # Filter out None values
-        valid_points = [(frames, rate) for frames, rate in zip(num_frames_list, fault_rates) if rate is not None]
-        if valid_points:
-            frames, rates = zip(*valid_points)
-            plt.plot(frames, rates, marker='o', linewidth=2, label=alg, markersize=8)
+    frames = np.asarray(num_frames_list)
+    for alg, fault_rates in zip(ALGORITHMS, results):
+        # Skip failed runs
+        mask = ~np.isnan(fault_rates)
+        if mask.any():
+            ax.plot(frames[mask], fault_rates[mask], marker='o', linewidth=2, label=alg, markersize=8)
     
-    plt.xlabel('Number of Physical Frames', fontsize=12, fontweight='bold')
-    plt.ylabel('Page Fault Rate (%)', fontsize=12, fontweight='bold')
-    plt.title(f'Page Replacement Algorithm Comparison\nAccess Pattern: {pattern_name}', 
-              fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
+    ax.set_xlabel('Number of Physical Frames', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Page Fault Rate (%)', fontsize=12, fontweight='bold')
+    ax.set_title(f'Page Replacement Algorithm Comparison\nAccess Pattern: {pattern_name}', 
+                 fontsize=14, fontweight='bold')
+    ax.legend(fontsize=10)
+    ax.grid(True, alpha=0.3)
     
     filename = f'comparison_{pattern_name}.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    fig.savefig(filename, dpi=150, bbox_inches='tight')
+    plt.close(fig)
     print(f"\nPlot saved to: {filename}")
     
     return filename
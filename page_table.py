@@ -3,8 +3,14 @@ Page Table Implementation for Virtual Memory Simulator
 Handles virtual-to-physical address translation
 """
 
+import numpy as np
+
+
 class PageTableEntry:
-    """Represents a single page table entry"""
+    """Snapshot of a single page table entry"""
+    __slots__ = ('valid', 'frame_number', 'referenced', 'modified',
+                 'last_access_time', 'access_count')
+    
     def __init__(self, frame_number=None):
         self.valid = False  # Is page in physical memory?
         self.frame_number = frame_number  # Physical frame number
@@ -12,49 +18,101 @@ class PageTableEntry:
         self.modified = False  # Dirty bit
         self.last_access_time = 0  # For LRU tracking
         self.access_count = 0  # For LFU algorithm
-        
+    
     def __repr__(self):
         return f"PTE(valid={self.valid}, frame={self.frame_number}, ref={self.referenced})"
 
 
 class PageTable:
-    """Main page table structure"""
+    """Main page table structure
+    
+    Entries are stored as one NumPy array per field (struct of arrays)
+    rather than one Python object per page.
+    """
     def __init__(self, num_pages):
         self.num_pages = num_pages
-        self.entries = [PageTableEntry() for _ in range(num_pages)]
-        
+        self.valid = np.zeros(num_pages, dtype=bool)
+        self.frame_number = np.full(num_pages, -1, dtype=np.int32)  # -1 = no frame
+        self.referenced = np.zeros(num_pages, dtype=bool)
+        self.modified = np.zeros(num_pages, dtype=bool)
+        self.last_access_time = np.zeros(num_pages, dtype=np.int64)
+        self.access_count = np.zeros(num_pages, dtype=np.int32)
+    
+    def clear(self):
+        """Reset every entry to its initial state, in place"""
+        self.valid.fill(False)
+        self.frame_number.fill(-1)
+        self.referenced.fill(False)
+        self.modified.fill(False)
+        self.last_access_time.fill(0)
+        self.access_count.fill(0)
+    
     def get_entry(self, page_number):
-        """Get page table entry for a virtual page"""
+        """Get a snapshot of the page table entry for a virtual page"""
         if page_number >= self.num_pages:
             raise ValueError(f"Invalid page number: {page_number}")
-        return self.entries[page_number]
+        frame_number = int(self.frame_number[page_number])
+        entry = PageTableEntry(frame_number if frame_number >= 0 else None)
+        entry.valid = bool(self.valid[page_number])
+        entry.referenced = bool(self.referenced[page_number])
+        entry.modified = bool(self.modified[page_number])
+        entry.last_access_time = int(self.last_access_time[page_number])
+        entry.access_count = int(self.access_count[page_number])
+        return entry
     
     def is_valid(self, page_number):
         """Check if page is in physical memory"""
-        return self.entries[page_number].valid
+        return bool(self.valid[page_number])
     
     def get_frame_number(self, page_number):
         """Get physical frame number for a page"""
-        if not self.is_valid(page_number):
+        if not self.valid[page_number]:
             return None
-        return self.entries[page_number].frame_number
+        return int(self.frame_number[page_number])
     
     def set_frame(self, page_number, frame_number):
         """Map virtual page to physical frame"""
-        entry = self.entries[page_number]
-        entry.valid = True
-        entry.frame_number = frame_number
-        
+        self.valid[page_number] = True
+        self.frame_number[page_number] = frame_number
+    
     def invalidate(self, page_number):
         """Mark page as not in memory"""
-        self.entries[page_number].valid = False
-        self.entries[page_number].frame_number = None
+        self.valid[page_number] = False
+        self.frame_number[page_number] = -1
+    
+    def update_access(self, page_number, time, is_write=False, count=1):
+        """Update access information for replacement algorithms
         
-    def update_access(self, page_number, time, is_write=False):
-        """Update access information for replacement algorithms"""
-        entry = self.entries[page_number]
-        entry.referenced = True
-        entry.last_access_time = time
-        entry.access_count += 1
+        count > 1 records a run of accesses ending at time.
+        """
+        self.referenced[page_number] = True
+        self.last_access_time[page_number] = time
+        self.access_count[page_number] += count
         if is_write:
-            entry.modified = True
+            self.modified[page_number] = True
+    
+    def record_accesses(self, pages, first_time, writes=None):
+        """Update access information for a whole sequence of accesses at once
+        
+        pages[i] is accessed at time first_time + i; writes, if given, is a
+        boolean array marking which accesses are writes. Equivalent to calling
+        update_access for each access in order.
+        """
+        if len(pages) == 0:
+            return
+        if pages.dtype.kind == 'i':
+            # Negative page numbers index from the end, as in update_access
+            pages = pages % self.num_pages
+        
+        counts = np.bincount(pages, minlength=self.num_pages)
+        self.access_count += counts.astype(self.access_count.dtype)
+        self.referenced |= counts > 0
+        
+        # Last index at which each page was accessed
+        last = np.full(self.num_pages, -1, dtype=np.int64)
+        np.maximum.at(last, pages, np.arange(len(pages)))
+        seen = last >= 0
+        self.last_access_time[seen] = first_time + last[seen]
+        
+        if writes is not None:
+            self.modified[pages[writes]] = True
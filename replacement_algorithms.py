@@ -3,33 +3,81 @@ Page Replacement Algorithms
 Implements FIFO, LRU, LFU, and Optimal page replacement
 """
 
-from collections import deque
-from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
 
+import numpy as np
 
-class PageReplacementAlgorithm(ABC):
+
+@dataclass
+class ReferenceTrace:
+    """Reference string preprocessed once and shared across simulations"""
+    array: np.ndarray      # Page numbers as int64
+    keys: np.ndarray       # page * (len + 1) + index for every reference, sorted
+    next_use: np.ndarray   # Index of the next reference to the same page, len if none
+    
+    @classmethod
+    def from_sequence(cls, reference_string):
+        """Build a trace from any sequence of page numbers"""
+        refs = np.asarray(reference_string, dtype=np.int64)
+        order = np.argsort(refs, kind='stable')
+        sorted_refs = refs[order]
+        keys = sorted_refs * (len(refs) + 1) + order
+        
+        # Within each page's run of the stable sort, every index is followed
+        # by that page's next reference
+        next_use = np.full(len(refs), len(refs), dtype=np.int64)
+        same_page = sorted_refs[1:] == sorted_refs[:-1]
+        next_use[order[:-1][same_page]] = order[1:][same_page]
+        return cls(refs, keys, next_use)
+
+
+class PageReplacementAlgorithm:
     """Base class for page replacement algorithms"""
     
     def __init__(self, num_frames):
         self.num_frames = num_frames
         self.frames = []  # List of page numbers currently in frames
+        self._frame_set = set()  # Same pages, for O(1) membership tests
+        self._frame_pos = {}  # page_number -> index in self.frames
         
-    @abstractmethod
     def access_page(self, page_number, time, is_write=False):
         """
         Access a page and return whether a page fault occurred
         Returns: (page_fault, victim_page)
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_victim(self):
         """Select a page to evict"""
-        pass
+        raise NotImplementedError
     
     def is_page_in_memory(self, page_number):
         """Check if page is already in physical memory"""
-        return page_number in self.frames
+        return page_number in self._frame_set
+    
+    def _add_frame(self, page_number):
+        """Place a page in the next free frame"""
+        self._frame_pos[page_number] = len(self.frames)
+        self.frames.append(page_number)
+        self._frame_set.add(page_number)
+    
+    def _remove_frame(self, page_number):
+        """Remove a page from the frames (swap with last entry and pop)"""
+        index = self._frame_pos.pop(page_number)
+        last = self.frames.pop()
+        if last != page_number:
+            self.frames[index] = last
+            self._frame_pos[last] = index
+        self._frame_set.discard(page_number)
+    
+    def _replace_frame(self, victim, page_number):
+        """Load a page into the frame held by victim"""
+        index = self._frame_pos.pop(victim)
+        self.frames[index] = page_number
+        self._frame_pos[page_number] = index
+        self._frame_set.discard(victim)
+        self._frame_set.add(page_number)
 
 
 class FIFO(PageReplacementAlgorithm):
@@ -37,7 +85,9 @@ class FIFO(PageReplacementAlgorithm):
     
     def __init__(self, num_frames):
         super().__init__(num_frames)
-        self.queue = deque()
+        # self.frames is the ring; a new page always takes its victim's
+        # slot, so the oldest page is the one at head
+        self.head = 0
         
     def access_page(self, page_number, time, is_write=False):
         if self.is_page_in_memory(page_number):
@@ -46,17 +96,17 @@ class FIFO(PageReplacementAlgorithm):
         # Page fault occurred
         victim = None
         if len(self.frames) >= self.num_frames:
-            victim = self.get_victim()
-            self.frames.remove(victim)
-            self.queue.remove(victim)
+            victim = self.frames[self.head]
+            self._replace_frame(victim, page_number)
+            self.head = (self.head + 1) % self.num_frames
+        else:
+            self._add_frame(page_number)
         
-        self.frames.append(page_number)
-        self.queue.append(page_number)
         return True, victim
     
     def get_victim(self):
-        """Remove oldest page (first in queue)"""
-        return self.queue[0]
+        """Remove oldest page (head of the ring buffer)"""
+        return self.frames[self.head]
 
 
 class LRU(PageReplacementAlgorithm):
@@ -64,7 +114,8 @@ class LRU(PageReplacementAlgorithm):
     
     def __init__(self, num_frames):
         super().__init__(num_frames)
-        self.access_times = {}  # page_number -> last_access_time
+        # page_number -> last_access_time, least recently used first
+        self.access_times = OrderedDict()
         
     def access_page(self, page_number, time, is_write=False):
         page_fault = not self.is_page_in_memory(page_number)
@@ -72,11 +123,12 @@ class LRU(PageReplacementAlgorithm):
         
         if page_fault:
             if len(self.frames) >= self.num_frames:
-                victim = self.get_victim()
-                self.frames.remove(victim)
-                del self.access_times[victim]
+                victim, _ = self.access_times.popitem(last=False)
+                self._remove_frame(victim)
             
-            self.frames.append(page_number)
+            self._add_frame(page_number)
+        else:
+            self.access_times.move_to_end(page_number)
         
         # Update access time
         self.access_times[page_number] = time
@@ -84,7 +136,7 @@ class LRU(PageReplacementAlgorithm):
     
     def get_victim(self):
         """Remove least recently used page"""
-        return min(self.access_times, key=self.access_times.get)
+        return next(iter(self.access_times))
 
 
 class LFU(PageReplacementAlgorithm):
@@ -93,79 +145,115 @@ class LFU(PageReplacementAlgorithm):
     def __init__(self, num_frames):
         super().__init__(num_frames)
         self.access_counts = {}  # page_number -> access_count
-        self.access_times = {}   # For tie-breaking (use LRU)
+        # access_count -> OrderedDict(page_number -> last_access_time) of the
+        # pages with that count, least recently used first (LRU for ties)
+        self._buckets = {}
+        self._min_count = 0
         
     def access_page(self, page_number, time, is_write=False):
         page_fault = not self.is_page_in_memory(page_number)
         victim = None
+        buckets = self._buckets
         
         if page_fault:
             if len(self.frames) >= self.num_frames:
-                victim = self.get_victim()
-                self.frames.remove(victim)
+                bucket = buckets[self._min_count]
+                victim, _ = bucket.popitem(last=False)
+                if not bucket:
+                    del buckets[self._min_count]
+                self._remove_frame(victim)
                 del self.access_counts[victim]
-                del self.access_times[victim]
             
-            self.frames.append(page_number)
-            self.access_counts[page_number] = 0
+            self._add_frame(page_number)
+            count = 0
+            self._min_count = 1
+        else:
+            # Move the page up to the next count's bucket
+            count = self.access_counts[page_number]
+            bucket = buckets[count]
+            del bucket[page_number]
+            if not bucket:
+                del buckets[count]
+                if self._min_count == count:
+                    self._min_count = count + 1
         
         # Update access count and time
-        self.access_counts[page_number] += 1
-        self.access_times[page_number] = time
+        count += 1
+        self.access_counts[page_number] = count
+        bucket = buckets.get(count)
+        if bucket is None:
+            bucket = buckets[count] = OrderedDict()
+        bucket[page_number] = time
         return page_fault, victim
     
     def get_victim(self):
         """Remove least frequently used page (LRU for ties)"""
-        min_count = min(self.access_counts.values())
-        candidates = [p for p, count in self.access_counts.items() if count == min_count]
-        
-        if len(candidates) == 1:
-            return candidates[0]
-        
-        # Tie-break using LRU
-        return min(candidates, key=lambda p: self.access_times[p])
+        return next(iter(self._buckets[self._min_count]))
 
 
 class Optimal(PageReplacementAlgorithm):
     """Optimal page replacement (requires future knowledge)"""
     
     def __init__(self, num_frames, reference_string):
+        """reference_string may be a sequence or a prebuilt ReferenceTrace"""
         super().__init__(num_frames)
+        
+        if isinstance(reference_string, ReferenceTrace):
+            trace = reference_string
+            reference_string = trace.array
+        else:
+            trace = ReferenceTrace.from_sequence(reference_string)
+        
         self.reference_string = reference_string
         self.current_index = 0
+        # Every page's reference positions, flattened into one sorted array,
+        # to find a page's next use when it is loaded
+        self._keys = trace.keys
+        self._stride = len(trace.array) + 1
+        self._never_used = len(trace.array)  # Sorts after every real position
+        # From then on it is followed along the precomputed next_use chain
+        self._next_use = trace.next_use
+        self._frame_next_use = np.full(num_frames, self._never_used, dtype=np.int64)  # Same order as self.frames
         
     def access_page(self, page_number, time, is_write=False):
         page_fault = not self.is_page_in_memory(page_number)
         victim = None
         
         if page_fault:
+            next_use = self._frame_next_use
             if len(self.frames) >= self.num_frames:
                 victim = self.get_victim()
-                self.frames.remove(victim)
+                # Mirror the swap-pop in _remove_frame
+                next_use[self._frame_pos[victim]] = next_use[len(self.frames) - 1]
+                self._remove_frame(victim)
             
-            self.frames.append(page_number)
+            next_use[len(self.frames)] = self._first_use(page_number)
+            self._add_frame(page_number)
         
         self.current_index += 1
         return page_fault, victim
     
+    def _first_use(self, page_number):
+        """First reference to a page at or after current_index"""
+        keys = self._keys
+        base = page_number * self._stride
+        i = np.searchsorted(keys, base + self.current_index)
+        if i < len(keys) and keys[i] < base + self._stride:
+            return keys[i] - base
+        return self._never_used
+    
     def get_victim(self):
         """Remove page that won't be used for longest time"""
-        farthest_use = -1
-        victim = None
-        
-        for page in self.frames:
-            # Find next use of this page
-            next_use = float('inf')
-            for i in range(self.current_index, len(self.reference_string)):
-                if self.reference_string[i] == page:
-                    next_use = i
-                    break
-            
-            if next_use > farthest_use:
-                farthest_use = next_use
-                victim = page
+        next_use = self._frame_next_use[:len(self.frames)]
         
-        return victim
+        # Step uses that are already in the past along the next_use chain
+        # (the sentinel _never_used never needs stepping)
+        current = min(self.current_index, self._never_used)
+        stale = next_use < current
+        while stale.any():
+            next_use[stale] = self._next_use[next_use[stale]]
+            stale = next_use < current
+        return self.frames[int(np.argmax(next_use))]
 
 
 class Clock(PageReplacementAlgorithm):
@@ -173,37 +261,40 @@ class Clock(PageReplacementAlgorithm):
     
     def __init__(self, num_frames):
         super().__init__(num_frames)
-        self.reference_bits = {}  # page_number -> reference_bit
+        # self.frames is the ring; a new page always takes its victim's slot
+        self.ref_bits = [0] * num_frames  # Reference bit of each frame slot
         self.clock_hand = 0
         
     def access_page(self, page_number, time, is_write=False):
-        page_fault = not self.is_page_in_memory(page_number)
+        slot = self._frame_pos.get(page_number)
+        page_fault = slot is None
         victim = None
         
         if page_fault:
             if len(self.frames) >= self.num_frames:
-                victim = self.get_victim()
-                victim_index = self.frames.index(victim)
-                self.frames[victim_index] = page_number
-                del self.reference_bits[victim]
+                slot = self.get_victim()
+                victim = self.frames[slot]
+                self._replace_frame(victim, page_number)
             else:
-                self.frames.append(page_number)
+                slot = len(self.frames)
+                self._add_frame(page_number)
         
         # Set reference bit
-        self.reference_bits[page_number] = 1
+        self.ref_bits[slot] = 1
         return page_fault, victim
     
     def get_victim(self):
-        """Use clock algorithm to find victim"""
-        while True:
-            page = self.frames[self.clock_hand]
-            
-            if self.reference_bits[page] == 0:
-                # Found victim
-                victim = page
-                self.clock_hand = (self.clock_hand + 1) % len(self.frames)
-                return victim
-            else:
-                # Give second chance
-                self.reference_bits[page] = 0
-                self.clock_hand = (self.clock_hand + 1) % len(self.frames)
+        """Use clock algorithm to find victim; returns its frame slot"""
+        ref_bits = self.ref_bits
+        n = len(self.frames)
+        hand = self.clock_hand
+        
+        while ref_bits[hand]:
+            # Give second chance
+            ref_bits[hand] = 0
+            hand += 1
+            if hand == n:
+                hand = 0
+        
+        self.clock_hand = hand + 1 if hand + 1 < n else 0
+        return hand
@@ -0,0 +1,252 @@
+"""
+Numba-compiled Page Replacement Kernels
+Runs FIFO, LRU and Clock over a whole reference string in one compiled loop,
+then replays the TLB and page table for that trace in a second one
+
+The simulator only consults its replacement algorithm on a page fault
+(see VirtualMemorySimulator._handle_page_fault), so these kernels update
+replacement state on faults only and produce the same victims as the
+classes in replacement_algorithms.py.
+
+Kernels take C-contiguous arrays (np.ascontiguousarray): refs in the
+simulator's _ref_dtype (uint16 or uint32 for up to 2**16 or 2**32 pages,
+int64 otherwise), the page table arrays as PageTable allocates them, and
+the TLB's tags (int64) and frames (int32), built from its lists for the
+replay. They release the GIL while running, so simulations of different
+algorithms can replay on separate threads.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator - kernels run as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+from replacement_algorithms import FIFO, LRU, Clock
+
+
+@njit(cache=True, nogil=True)
+def fifo_run(refs, num_frames, num_pages):
+    """
+    FIFO over refs using a ring buffer of resident pages
+    Returns: (faults, victims, queue, head, size)
+    """
+    n = len(refs)
+    faults = np.zeros(n, dtype=np.bool_)
+    victims = np.full(n, -1, dtype=np.int64)
+    resident = np.zeros(num_pages, dtype=np.bool_)
+    queue = np.empty(num_frames, dtype=np.int64)  # Oldest page at head
+    head = 0
+    size = 0
+    
+    for i in range(n):
+        page = refs[i]
+        if resident[page]:
+            continue
+        
+        faults[i] = True
+        if size == num_frames:
+            victim = queue[head]
+            resident[victim] = False
+            victims[i] = victim
+            queue[head] = page
+            head = (head + 1) % num_frames
+        else:
+            queue[(head + size) % num_frames] = page
+            size += 1
+        resident[page] = True
+    
+    return faults, victims, queue, head, size
+
+
+@njit(cache=True, nogil=True)
+def lru_run(refs, num_frames, num_pages, time_offset):
+    """
+    LRU over refs using parallel frame_page/frame_time arrays
+    Returns: (faults, victims, frame_page, frame_time, size)
+    """
+    n = len(refs)
+    faults = np.zeros(n, dtype=np.bool_)
+    victims = np.full(n, -1, dtype=np.int64)
+    resident = np.zeros(num_pages, dtype=np.bool_)
+    frame_page = np.full(num_frames, -1, dtype=np.int64)
+    frame_time = np.zeros(num_frames, dtype=np.int64)
+    size = 0
+    
+    for i in range(n):
+        page = refs[i]
+        if resident[page]:
+            continue
+        
+        faults[i] = True
+        if size == num_frames:
+            # Linear min-search - cheap for the small frame counts simulated
+            slot = 0
+            for j in range(1, num_frames):
+                if frame_time[j] < frame_time[slot]:
+                    slot = j
+            victim = frame_page[slot]
+            resident[victim] = False
+            victims[i] = victim
+        else:
+            slot = size
+            size += 1
+        frame_page[slot] = page
+        frame_time[slot] = time_offset + i + 1
+        resident[page] = True
+    
+    return faults, victims, frame_page, frame_time, size
+
+
+@njit(cache=True, nogil=True)
+def clock_run(refs, num_frames, num_pages):
+    """
+    Clock over refs using frame_page/ref_bit arrays and a hand index
+    Returns: (faults, victims, frame_page, ref_bit, hand, size)
+    """
+    n = len(refs)
+    faults = np.zeros(n, dtype=np.bool_)
+    victims = np.full(n, -1, dtype=np.int64)
+    resident = np.zeros(num_pages, dtype=np.bool_)
+    frame_page = np.full(num_frames, -1, dtype=np.int64)
+    ref_bit = np.zeros(num_frames, dtype=np.uint8)
+    hand = 0
+    size = 0
+    
+    for i in range(n):
+        page = refs[i]
+        if resident[page]:
+            continue
+        
+        faults[i] = True
+        if size == num_frames:
+            while ref_bit[hand] == 1:
+                # Give second chance
+                ref_bit[hand] = 0
+                hand = (hand + 1) % num_frames
+            slot = hand
+            hand = (hand + 1) % num_frames
+            victim = frame_page[slot]
+            resident[victim] = False
+            victims[i] = victim
+        else:
+            slot = size
+            size += 1
+        frame_page[slot] = page
+        ref_bit[slot] = 1
+        resident[page] = True
+    
+    return faults, victims, frame_page, ref_bit, hand, size
+
+
+@njit(cache=True, nogil=True)
+def replay_trace(refs, writes, faults, victims, time_offset, tlb_tags, tlb_frames,
+                 valid, frame_number, referenced, modified, last_access_time, access_count):
+    """
+    Replay the TLB and page table for a trace whose faults and victims are known
+    
+    The TLB is direct-mapped, like virtual_memory.TLB: tlb_tags holds the
+    page cached in each slot (-1 = empty) and its length is a power of two.
+    Free frames are handed out from 0 upwards. All arrays are updated in place.
+    
+    Returns: (tlb_hits, tlb_misses, frames_used)
+    """
+    mask = len(tlb_tags) - 1
+    tlb_hits = 0
+    tlb_misses = 0
+    frames_used = 0
+    
+    for i in range(len(refs)):
+        page = refs[i]
+        slot = ((page >> 3) ^ page) & mask
+        
+        if tlb_tags[slot] == page:
+            tlb_hits += 1
+        else:
+            tlb_misses += 1
+            if faults[i]:
+                victim = victims[i]
+                if victim >= 0:
+                    # Evict victim page and take its frame
+                    frame = frame_number[victim]
+                    valid[victim] = False
+                    frame_number[victim] = -1
+                    victim_slot = ((victim >> 3) ^ victim) & mask
+                    if tlb_tags[victim_slot] == victim:
+                        tlb_tags[victim_slot] = -1
+                else:
+                    frame = frames_used
+                    frames_used += 1
+                valid[page] = True
+                frame_number[page] = frame
+            
+            tlb_tags[slot] = page
+            tlb_frames[slot] = frame_number[page]
+        
+        referenced[page] = True
+        last_access_time[page] = time_offset + i + 1
+        access_count[page] += 1
+        if writes[i]:
+            modified[page] = True
+    
+    return tlb_hits, tlb_misses, frames_used
+
+
+def _load_frames(algorithm, pages):
+    """Reset an algorithm's frame bookkeeping to the given pages"""
+    algorithm.frames = list(pages)
+    algorithm._frame_set = set(algorithm.frames)
+    algorithm._frame_pos = {page: i for i, page in enumerate(algorithm.frames)}
+
+
+def run_kernel(algorithm, refs, num_pages, time_offset=0):
+    """
+    Run the compiled kernel matching algorithm over refs
+    
+    Leaves algorithm in the state its own access_page calls would have
+    produced. Only starts from an empty set of frames.
+    
+    Returns: (faults, victims) arrays with one entry per reference
+             (victim -1 when no page is evicted), or None if no kernel applies
+    """
+    if not NUMBA_AVAILABLE or algorithm.frames:
+        return None
+    # The kernels index frame arrays without bounds checks; leave an empty
+    # memory to the Python path, which raises a normal exception
+    if algorithm.num_frames < 1:
+        return None
+    if len(refs) and (refs.min() < 0 or refs.max() >= num_pages):
+        return None
+    
+    num_frames = algorithm.num_frames
+    
+    if type(algorithm) is FIFO:
+        faults, victims, queue, head, size = fifo_run(refs, num_frames, num_pages)
+        _load_frames(algorithm, queue[:size].tolist())
+        algorithm.head = int(head)
+    
+    elif type(algorithm) is LRU:
+        faults, victims, frame_page, frame_time, size = lru_run(
+            refs, num_frames, num_pages, time_offset)
+        _load_frames(algorithm, frame_page[:size].tolist())
+        order = np.argsort(frame_time[:size])
+        algorithm.access_times.update(zip(frame_page[order].tolist(), frame_time[order].tolist()))
+    
+    elif type(algorithm) is Clock:
+        faults, victims, frame_page, ref_bit, hand, size = clock_run(refs, num_frames, num_pages)
+        _load_frames(algorithm, frame_page[:size].tolist())
+        algorithm.ref_bits[:] = ref_bit.tolist()
+        algorithm.clock_hand = int(hand)
+    
+    else:
+        return None
+    
+    return faults, victims
@@ -4,15 +4,36 @@ Run comprehensive tests to verify correctness
 """
 
 import sys
-from virtual_memory import VirtualMemorySimulator
-from replacement_algorithms import FIFO, LRU, LFU, Optimal, Clock
+import numpy as np
+from virtual_memory import VirtualMemorySimulator, TLB
+from replacement_algorithms import FIFO, LRU, LFU, Optimal, Clock, ReferenceTrace
+import replacement_algorithms_numba
+from replacement_algorithms_numba import fifo_run, lru_run, clock_run, replay_trace, run_kernel
+from page_table import PageTable
+
+
+# Simulators shared across tests, keyed by the settings reset() keeps
+_sim_cache = {}
+
+
+def make_sim(num_pages, num_frames, page_size, tlb_size, algorithm_name, reference_string=None):
+    """Return a freshly reset simulator, reusing one built by an earlier test"""
+    key = (num_pages, page_size, tlb_size)
+    sim = _sim_cache.get(key)
+    if sim is None:
+        sim = _sim_cache[key] = VirtualMemorySimulator(
+            num_pages, num_frames, page_size, tlb_size, algorithm_name, reference_string
+        )
+    else:
+        sim.reset(num_frames, algorithm_name, reference_string)
+    return sim
 
 
 def test_fifo_basic():
     """Test basic FIFO behavior"""
     print("Testing FIFO Algorithm...")
     
-    sim = VirtualMemorySimulator(
+    sim = make_sim(
         num_pages=10,
         num_frames=3,
         page_size=4096,
@@ -35,7 +56,7 @@ def test_lru_basic():
     """Test basic LRU behavior"""
     print("Testing LRU Algorithm...")
     
-    sim = VirtualMemorySimulator(
+    sim = make_sim(
         num_pages=10,
         num_frames=3,
         page_size=4096,
@@ -62,7 +83,7 @@ def test_optimal_best():
     
     results = {}
     for alg in ['FIFO', 'LRU', 'Optimal']:
-        sim = VirtualMemorySimulator(
+        sim = make_sim(
             num_pages=10,
             num_frames=num_frames,
             page_size=4096,
@@ -79,11 +100,70 @@ def test_optimal_best():
     return True
 
 
+def test_optimal_victim_selection():
+    """Test Optimal evicts the page used farthest in the future"""
+    print("Testing Optimal victim selection...")
+    
+    reference_string = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+    algorithm = Optimal(3, reference_string)
+    
+    faults = 0
+    for time, page in enumerate(reference_string):
+        page_fault, victim = algorithm.access_page(page, time)
+        faults += page_fault
+    
+    # Belady's example: 7 faults with 3 frames
+    assert faults == 7, f"Expected 7 page faults, got {faults}"
+    
+    next_use = ReferenceTrace.from_sequence([1, 2, 1, 3, 2]).next_use.tolist()
+    assert next_use == [2, 4, 5, 5, 5], f"Unexpected next-use indices: {next_use}"
+    print(f"✓ Optimal victim selection test passed: {faults} page faults")
+    return True
+
+
+def test_lfu_victim_selection():
+    """Test LFU evicts the least used page, oldest first on ties"""
+    print("Testing LFU victim selection...")
+    
+    algorithm = LFU(3)
+    victims = []
+    for time, page in enumerate([1, 2, 3, 4, 2, 5, 6]):
+        page_fault, victim = algorithm.access_page(page, time)
+        if victim is not None:
+            victims.append(victim)
+    
+    # 1, 3 and 4 tie at one access each and go least recently used first;
+    # page 2, accessed twice, is never chosen
+    assert victims == [1, 3, 4], f"Unexpected LFU victims: {victims}"
+    print(f"✓ LFU victim selection test passed: victims {victims}")
+    return True
+
+
+def test_clock_victim_selection():
+    """Test Clock gives referenced pages a second chance across wraparound"""
+    print("Testing Clock victim selection...")
+    
+    algorithm = Clock(3)
+    victims = []
+    for time, page in enumerate([1, 2, 3, 4, 2, 5, 6, 7, 8]):
+        page_fault, victim = algorithm.access_page(page, time)
+        if victim is not None:
+            victims.append(victim)
+    
+    # Page 7's sweep starts at the last slot, clears page 5's bit and wraps
+    # to evict page 4; page 8 then finds page 5 unreferenced
+    assert victims == [1, 3, 2, 4, 5], f"Unexpected Clock victims: {victims}"
+    assert algorithm.frames == [7, 6, 8], f"Unexpected Clock frames: {algorithm.frames}"
+    assert algorithm.ref_bits == [1, 0, 1], f"Unexpected Clock reference bits: {algorithm.ref_bits}"
+    print(f"✓ Clock victim selection test passed: victims {victims}")
+    return True
+
+
 def test_tlb_functionality():
     """Test TLB hit/miss tracking"""
     print("Testing TLB functionality...")
     
-    sim = VirtualMemorySimulator(
+    sim = make_sim(
         num_pages=20,
         num_frames=10,
         page_size=4096,
@@ -102,6 +182,35 @@ def test_tlb_functionality():
     return True
 
 
+def test_tlb_direct_mapped():
+    """Test TLB slot mapping, collisions and invalidation"""
+    print("Testing direct-mapped TLB...")
+    
+    tlb = TLB(5)
+    assert tlb.size == 8, f"Expected size rounded up to 8, got {tlb.size}"
+    
+    # An empty slot never matches, not even page -1
+    assert tlb.lookup(-1) == -1, "Empty TLB should miss"
+    
+    # Slot is ((p >> 3) ^ p) & 7: pages 0 and 8 land in different slots,
+    # page 9 shares slot 0 with page 0
+    tlb.insert(0, 10)
+    tlb.insert(8, 11)
+    assert tlb.lookup(0) == 10 and tlb.lookup(8) == 11, "Pages 0 and 8 should both be cached"
+    tlb.insert(9, 12)
+    assert tlb.lookup(0) == -1, "Page 9 should replace page 0 in slot 0"
+    assert tlb.lookup(9) == 12, "Page 9 should be cached"
+    
+    # Invalidating a page only clears its slot if the slot still holds it
+    tlb.invalidate(0)
+    assert tlb.lookup(9) == 12, "Invalidating page 0 should leave page 9"
+    tlb.invalidate(9)
+    assert tlb.lookup(9) == -1, "Page 9 should be invalidated"
+    
+    assert (tlb.hits, tlb.misses) == (4, 3), f"Unexpected hits/misses: {tlb.hits}/{tlb.misses}"
+    print(f"✓ Direct-mapped TLB test passed")
+    return True
+
 def test_no_page_faults_when_sufficient_frames():
     """Test that no page faults occur when frames >= unique pages"""
     print("Testing sufficient frames scenario...")
@@ -109,7 +218,7 @@ def test_no_page_faults_when_sufficient_frames():
     reference_string = [1, 2, 3, 1, 2, 3, 1, 2, 3]
     unique_pages = len(set(reference_string))
     
-    sim = VirtualMemorySimulator(
+    sim = make_sim(
         num_pages=20,
         num_frames=unique_pages,  # Enough frames for all unique pages
         page_size=4096,
@@ -131,7 +240,7 @@ def test_clock_algorithm():
     """Test Clock (Second Chance) algorithm"""
     print("Testing Clock Algorithm...")
     
-    sim = VirtualMemorySimulator(
+    sim = make_sim(
         num_pages=10,
         num_frames=3,
         page_size=4096,
@@ -158,7 +267,7 @@ def test_increasing_frames_reduces_faults():
     
     results = []
     for num_frames in [3, 5, 8]:
-        sim = VirtualMemorySimulator(
+        sim = make_sim(
             num_pages=20,
             num_frames=num_frames,
             page_size=4096,
@@ -180,7 +289,7 @@ def test_address_translation():
     """Test virtual to physical address translation"""
     print("Testing address translation...")
     
-    sim = VirtualMemorySimulator(
+    sim = make_sim(
         num_pages=100,
         num_frames=10,
         page_size=4096,
@@ -207,7 +316,7 @@ def test_lfu_basic():
     """Test LFU algorithm"""
     print("Testing LFU Algorithm...")
     
-    sim = VirtualMemorySimulator(
+    sim = make_sim(
         num_pages=10,
         num_frames=3,
         page_size=4096,
@@ -225,6 +334,152 @@ def test_lfu_basic():
     return True
 
 
+def test_simulator_reset():
+    """Test reset gives the same results as a freshly built simulator"""
+    print("Testing simulator reset...")
+    
+    reference_string = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+    
+    sim = VirtualMemorySimulator(
+        num_pages=10,
+        num_frames=4,
+        page_size=4096,
+        tlb_size=4,
+        algorithm_name='LRU'
+    )
+    sim.run_trace(reference_string)
+    
+    sim.reset(3, 'FIFO')
+    assert sim.get_statistics()['total_accesses'] == 0, "Reset should clear statistics"
+    sim.run_trace(reference_string)
+    
+    stats = sim.get_statistics()
+    assert stats['page_faults'] == 9, f"Expected 9 page faults, got {stats['page_faults']}"
+    print(f"✓ Simulator reset test passed: {stats['page_faults']} page faults")
+    return True
+
+
+def test_record_accesses():
+    """Test PageTable.record_accesses matches update_access called in order"""
+    print("Testing batched page table access recording...")
+    
+    rng = np.random.default_rng(7)
+    arrays = ['referenced', 'modified', 'last_access_time', 'access_count']
+    
+    # Negative pages index from the end; the second batch adds to the first
+    batches = [
+        (rng.integers(-10, 10, size=200), 5),
+        (rng.integers(0, 10, size=50).astype(np.uint16), 300),
+    ]
+    batched = PageTable(10)
+    looped = PageTable(10)
+    for pages, first_time in batches:
+        writes = rng.random(len(pages)) < 0.3
+        batched.record_accesses(pages, first_time, writes)
+        for i, page in enumerate(pages.tolist()):
+            looped.update_access(page, first_time + i, writes[i])
+        
+        for name in arrays:
+            assert np.array_equal(getattr(batched, name), getattr(looped, name)), \
+                f"record_accesses: {name} differs from update_access"
+    
+    print(f"✓ Batched access recording test passed")
+    return True
+
+def test_replacement_kernels():
+    """Test compiled kernels fault exactly where the simulator does"""
+    print("Testing replacement kernels...")
+    
+    reference_string = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5, 7, 7, 1, 6, 2, 3]
+    refs = np.asarray(reference_string, dtype=np.int64)
+    kernels = {
+        'FIFO': lambda: fifo_run(refs, 3, 10),
+        'LRU': lambda: lru_run(refs, 3, 10, 0),
+        'Clock': lambda: clock_run(refs, 3, 10),
+    }
+    
+    for alg, kernel in kernels.items():
+        sim = make_sim(
+            num_pages=10,
+            num_frames=3,
+            page_size=4096,
+            tlb_size=4,
+            algorithm_name=alg
+        )
+        # One access at a time, so run_trace cannot hand the trace to the kernels
+        for page in reference_string:
+            sim.translate_address(page * 4096)
+        
+        faults, victims = kernel()[:2]
+        assert faults.sum() == sim.page_faults, \
+            f"{alg} kernel: expected {sim.page_faults} page faults, got {faults.sum()}"
+        
+        page_table = PageTable(10)
+        tlb_hits, tlb_misses, _ = replay_trace(
+            refs, np.zeros(len(refs), dtype=bool), faults, victims, 0,
+            np.full(4, -1, dtype=np.int64), np.zeros(4, dtype=np.int32),
+            page_table.valid, page_table.frame_number, page_table.referenced,
+            page_table.modified, page_table.last_access_time, page_table.access_count
+        )
+        assert tlb_hits == sim.tlb.hits, \
+            f"{alg} replay: expected {sim.tlb.hits} TLB hits, got {tlb_hits}"
+    
+    print(f"✓ Replacement kernel test passed")
+    return True
+
+
+def test_compiled_trace_matches_python():
+    """Test run_trace through the kernels leaves the same state as the Python path"""
+    print("Testing compiled run_trace against the Python path...")
+    
+    reference_string = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5, 7, 7, 1, 6, 2, 3]
+    follow_up = [3, 8, 1, 9, 9, 2, 0, 7]
+    writes = {1, 5, 12, 13}
+    arrays = ['valid', 'frame_number', 'referenced', 'modified', 'last_access_time', 'access_count']
+    # Replacement state the kernels hand back (LRU's frame order is free,
+    # its access_times order is not)
+    state = {
+        'FIFO': ['frames', 'head'],
+        'LRU': ['access_times'],
+        'Clock': ['frames', 'ref_bits', 'clock_hand'],
+    }
+    
+    # Without Numba the fallback njit leaves the kernels as plain Python,
+    # so forcing the flag exercises how their state is handed back
+    numba_available = replacement_algorithms_numba.NUMBA_AVAILABLE
+    try:
+        for alg in ['FIFO', 'LRU', 'Clock']:
+            sims = []
+            for compiled in (True, False):
+                replacement_algorithms_numba.NUMBA_AVAILABLE = compiled
+                sim = VirtualMemorySimulator(10, 3, 4096, 4, alg)
+                sim.run_trace(reference_string, writes)
+                sims.append(sim)
+            
+            replacement_algorithms_numba.NUMBA_AVAILABLE = True
+            assert run_kernel(type(sims[1].algorithm)(3), np.asarray(reference_string), 10) is not None, \
+                f"{alg}: no kernel ran"
+            
+            # Compare after the kernel run, then after a Python-path run on top of it
+            for stage in ('kernel run', 'follow-up run'):
+                compiled, python = sims
+                assert compiled.get_statistics() == python.get_statistics(), \
+                    f"{alg} {stage}: {compiled.get_statistics()} != {python.get_statistics()}"
+                for name in arrays:
+                    assert np.array_equal(getattr(compiled.page_table, name), getattr(python.page_table, name)), \
+                        f"{alg} {stage}: page table {name} differs"
+                for name in state[alg]:
+                    assert getattr(compiled.algorithm, name) == getattr(python.algorithm, name), \
+                        f"{alg} {stage}: {name} {getattr(compiled.algorithm, name)} != {getattr(python.algorithm, name)}"
+                
+                for sim in sims:
+                    sim.run_trace(follow_up)
+    finally:
+        replacement_algorithms_numba.NUMBA_AVAILABLE = numba_available
+    
+    print(f"✓ Compiled run_trace test passed")
+    return True
+
 def run_all_tests():
     """Run complete test suite"""
     print("\n" + "="*70)
@@ -237,10 +492,18 @@ def run_all_tests():
         test_lfu_basic,
         test_clock_algorithm,
         test_optimal_best,
+        test_optimal_victim_selection,
+        test_lfu_victim_selection,
+        test_clock_victim_selection,
         test_tlb_functionality,
+        test_tlb_direct_mapped,
         test_no_page_faults_when_sufficient_frames,
         test_increasing_frames_reduces_faults,
         test_address_translation,
+        test_simulator_reset,
+        test_record_accesses,
+        test_replacement_kernels,
+        test_compiled_trace_matches_python,
     ]
     
     passed = 0
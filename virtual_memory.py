@@ -3,45 +3,58 @@ Virtual Memory Simulator
 Main simulator that combines page table, TLB, and replacement algorithms
 """
 
-from collections import OrderedDict
+from collections import deque
+
+import numpy as np
+
 from page_table import PageTable
 from replacement_algorithms import *
+from replacement_algorithms_numba import run_kernel, replay_trace
 
 
 class TLB:
-    """Translation Lookaside Buffer - Cache for page table entries"""
+    """Translation Lookaside Buffer - Cache for page table entries
+    
+    Direct-mapped, like a small hardware TLB: each page can only live in
+    slot ((page_number >> 3) ^ page_number) & (size - 1), so a lookup is
+    one compare. Folding in page_number >> 3 spreads strided pages.
+    """
     
     def __init__(self, size):
-        self.size = size
-        self.cache = OrderedDict()  # LRU cache
+        # Round up to a power of two so the slot index is a mask
+        self.size = 1 << max(size - 1, 0).bit_length()
+        self._mask = self.size - 1
+        self.tags = [None] * self.size  # Page in each slot, None = empty
+        self.frames = [0] * self.size
         self.hits = 0
         self.misses = 0
         
     def lookup(self, page_number):
-        """Look up page in TLB"""
-        if page_number in self.cache:
+        """Look up page in TLB; returns its frame number, or -1 on a miss"""
+        slot = ((page_number >> 3) ^ page_number) & self._mask
+        if self.tags[slot] == page_number:
             self.hits += 1
-            # Move to end (most recently used)
-            self.cache.move_to_end(page_number)
-            return self.cache[page_number]
-        else:
-            self.misses += 1
-            return None
+            return self.frames[slot]
+        self.misses += 1
+        return -1
     
     def insert(self, page_number, frame_number):
-        """Insert page-to-frame mapping in TLB"""
-        if page_number in self.cache:
-            self.cache.move_to_end(page_number)
-        else:
-            if len(self.cache) >= self.size:
-                # Remove oldest entry
-                self.cache.popitem(last=False)
-            self.cache[page_number] = frame_number
+        """Insert page-to-frame mapping in TLB, replacing the slot's entry"""
+        slot = ((page_number >> 3) ^ page_number) & self._mask
+        self.tags[slot] = page_number
+        self.frames[slot] = frame_number
     
     def invalidate(self, page_number):
         """Remove entry from TLB"""
-        if page_number in self.cache:
-            del self.cache[page_number]
+        slot = ((page_number >> 3) ^ page_number) & self._mask
+        if self.tags[slot] == page_number:
+            self.tags[slot] = None
+    
+    def clear(self):
+        """Remove all entries and reset hit/miss counts"""
+        self.tags[:] = [None] * self.size
+        self.hits = 0
+        self.misses = 0
     
     def get_hit_rate(self):
         """Calculate TLB hit rate"""
@@ -62,13 +75,40 @@ class VirtualMemorySimulator:
             page_size: Size of each page in bytes
             tlb_size: Size of TLB
             algorithm_name: 'FIFO', 'LRU', 'LFU', 'Optimal', 'Clock'
-            reference_string: Page reference sequence (required for Optimal)
+            reference_string: Page reference sequence or a prebuilt ReferenceTrace
+                              (required for Optimal)
         """
         self.num_pages = num_pages
-        self.num_frames = num_frames
         self.page_size = page_size
+        # Power-of-two page sizes split addresses with a shift and mask
+        if page_size > 0 and page_size & (page_size - 1) == 0:
+            self._page_shift = page_size.bit_length() - 1
+        else:
+            self._page_shift = None
+        # Smallest dtype that holds every page number, for reference strings
+        if num_pages <= 1 << 16:
+            self._ref_dtype = np.uint16
+        elif num_pages <= 1 << 32:
+            self._ref_dtype = np.uint32
+        else:
+            self._ref_dtype = np.int64
         self.page_table = PageTable(num_pages)
         self.tlb = TLB(tlb_size)
+        self.reset(num_frames, algorithm_name, reference_string)
+        
+    def reset(self, num_frames, algorithm_name, reference_string=None):
+        """
+        Start a fresh simulation, reusing the page table and TLB storage
+        
+        Args:
+            num_frames: Number of physical frames
+            algorithm_name: 'FIFO', 'LRU', 'LFU', 'Optimal', 'Clock'
+            reference_string: Page reference sequence or a prebuilt ReferenceTrace
+                              (required for Optimal)
+        """
+        self.num_frames = num_frames
+        self.page_table.clear()
+        self.tlb.clear()
         
         # Initialize replacement algorithm
         if algorithm_name == 'FIFO':
@@ -95,10 +135,13 @@ class VirtualMemorySimulator:
         self.tlb_misses = 0
         self.current_time = 0
         
-        # Track free frames
-        self.free_frames = list(range(num_frames))
-        self.page_to_frame = {}  # Current mapping
+        # Track free frames; the page -> frame mapping lives in the page table
+        self.free_frames = deque(range(num_frames))
         
+        # Last translated page (None before any), checked before the TLB
+        self._last_page = None
+        self._last_frame = -1
+    
     def translate_address(self, virtual_address, is_write=False):
         """
         Translate virtual address to physical address
@@ -109,58 +152,101 @@ class VirtualMemorySimulator:
         self.current_time += 1
         
         # Extract page number and offset
-        page_number = virtual_address // self.page_size
-        offset = virtual_address % self.page_size
+        shift = self._page_shift
+        if shift is not None:
+            page_number = virtual_address >> shift
+            offset = virtual_address & (self.page_size - 1)
+        else:
+            page_number, offset = divmod(virtual_address, self.page_size)
+        
+        frame_number, page_fault, tlb_hit = self._translate_page(
+            page_number, is_write, self.current_time
+        )
+        
+        # Calculate physical address
+        if shift is not None:
+            physical_address = (frame_number << shift) | offset
+        else:
+            physical_address = frame_number * self.page_size + offset
+        
+        return physical_address, page_fault, tlb_hit
+    
+    def _translate_page(self, page_number, is_write, time):
+        """
+        Find the frame holding a page, faulting it in if needed
         
-        # Check TLB first
-        frame_number = self.tlb.lookup(page_number)
-        tlb_hit = (frame_number is not None)
+        Does not touch memory_accesses/current_time; callers account for
+        the access themselves.
         
+        Returns: (frame_number, page_fault_occurred, tlb_hit)
+        """
         page_fault = False
+        tlb_hit = True
         
-        if not tlb_hit:
-            # TLB miss - check page table
-            if not self.page_table.is_valid(page_number):
-                # Page fault!
-                page_fault = True
-                self.page_faults += 1
-                frame_number = self._handle_page_fault(page_number, is_write)
-            else:
-                # Page in memory, get from page table
-                frame_number = self.page_table.get_frame_number(page_number)
-            
-            # Update TLB
-            self.tlb.insert(page_number, frame_number)
+        if page_number == self._last_page:
+            # Same page as the previous access - still in its TLB slot
+            self.tlb.hits += 1
+            frame_number = self._last_frame
+        else:
+            frame_number = self.tlb.lookup(page_number)
+            if frame_number < 0:
+                tlb_hit = False
+                frame_number, page_fault = self._translate_miss(page_number, is_write, time)
+                self.page_faults += page_fault
+            self._last_page = page_number
+            self._last_frame = frame_number
         
         # Update page table access info
-        self.page_table.update_access(page_number, self.current_time, is_write)
+        self.page_table.update_access(page_number, time, is_write)
+        return frame_number, page_fault, tlb_hit
+    
+    def _translate_miss(self, page_number, is_write, time):
+        """
+        Translate a page the TLB lookup just missed (already counted)
         
-        # Calculate physical address
-        physical_address = frame_number * self.page_size + offset
+        The caller counts the page fault, if any, and records the access
+        in the page table.
         
-        return physical_address, page_fault, tlb_hit
+        Returns: (frame_number, page_fault_occurred)
+        """
+        page_table = self.page_table
+        page_fault = False
+        
+        # Check page table (read the entry arrays directly)
+        if not page_table.valid[page_number]:
+            # Page fault!
+            page_fault = True
+            frame_number = self._handle_page_fault(page_number, is_write, time)
+        else:
+            # Page in memory, get from page table
+            frame_number = int(page_table.frame_number[page_number])
+        
+        # Update TLB
+        self.tlb.insert(page_number, frame_number)
+        
+        return frame_number, page_fault
     
-    def _handle_page_fault(self, page_number, is_write):
+    def _handle_page_fault(self, page_number, is_write, time):
         """Handle a page fault"""
         # Use replacement algorithm to access page
         fault_occurred, victim_page = self.algorithm.access_page(
-            page_number, self.current_time, is_write
+            page_number, time, is_write
         )
         
         # Get a free frame or use victim's frame
         if victim_page is not None:
             # Evict victim page
-            frame_number = self.page_to_frame[victim_page]
+            frame_number = int(self.page_table.frame_number[victim_page])
             self.page_table.invalidate(victim_page)
             self.tlb.invalidate(victim_page)
-            del self.page_to_frame[victim_page]
+            if victim_page == self._last_page:
+                self._last_page = None
         else:
             # Use a free frame
-            frame_number = self.free_frames.pop(0)
+            frame_number = self.free_frames.popleft()
         
         # Load page into frame
         self.page_table.set_frame(page_number, frame_number)
-        self.page_to_frame[page_number] = frame_number
         
         return frame_number
     
@@ -169,14 +255,111 @@ class VirtualMemorySimulator:
         Run simulation on a reference string
         
         Args:
-            reference_string: List of page numbers to access
+            reference_string: Page numbers to access (list or NumPy array)
             write_operations: Set of indices in reference_string that are writes
         """
-        write_operations = write_operations or set()
+        refs = self._page_array(reference_string)
+        n = len(refs)
+        if n == 0:
+            return
+        
+        writes = np.zeros(n, dtype=bool)
+        if write_operations:
+            indices = np.fromiter(write_operations, dtype=np.int64)
+            writes[indices[(indices >= 0) & (indices < n)]] = True
+        
+        if self._run_compiled(refs, writes):
+            return
+        
+        # Split the trace into runs of the same page. Only the first access
+        # of a run needs a full translation; the rest are hits on the page
+        # just translated.
+        starts = np.flatnonzero(np.concatenate(([True], refs[1:] != refs[:-1])))
+        ends = np.append(starts[1:], n)
+        run_pages = refs[starts].tolist()
+        run_starts = starts.tolist()
+        run_writes = writes[starts].tolist()
+        
+        # Counters are kept in locals and written back once; the access at
+        # index i happens at time first_time + i. Page table access info
+        # is recorded for the whole trace after the loop.
+        first_time = self.current_time + 1
+        completed = 0  # Runs fully translated
+        page_faults = 0
+        lookup = self.tlb.lookup
+        translate_miss = self._translate_miss
+        try:
+            for page_number, start, is_write in zip(run_pages, run_starts, run_writes):
+                if lookup(page_number) < 0:
+                    _, page_fault = translate_miss(page_number, is_write, first_time + start)
+                    page_faults += page_fault
+                completed += 1
+        finally:
+            # An access whose translation raised still counts as made
+            recorded = int(ends[completed - 1]) if completed else 0
+            processed = recorded + (completed < len(run_pages))
+            self.memory_accesses += processed
+            self.current_time += processed
+            self.page_faults += page_faults
+            self.tlb.hits += recorded - completed
+            self.page_table.record_accesses(refs[:recorded], first_time, writes[:recorded])
+            self._last_page = None
+    
+    def _page_array(self, reference_string):
+        """
+        Reference string as a contiguous array of _ref_dtype
+        
+        Falls back to int64 when some page number is out of range, so the
+        simulation reports it the same way as before.
+        """
+        refs = np.asarray(reference_string)
+        if refs.dtype == self._ref_dtype:
+            return np.ascontiguousarray(refs)
+        
+        refs = np.ascontiguousarray(refs, dtype=np.int64)
+        if len(refs) and refs.min() >= 0 and refs.max() < self.num_pages:
+            refs = refs.astype(self._ref_dtype)
+        return refs
+    
+    def _run_compiled(self, refs, writes):
+        """
+        Run a whole trace through the Numba kernels
+        
+        Applies to FIFO, LRU and Clock on a freshly reset simulator when
+        Numba is installed. Returns False, changing nothing, otherwise.
+        """
+        tlb = self.tlb
+        if tlb.tags.count(None) != tlb.size or len(self.free_frames) != self.num_frames:
+            return False
+        
+        decisions = run_kernel(self.algorithm, refs, self.num_pages, self.current_time)
+        if decisions is None:
+            return False
+        faults, victims = decisions
+        
+        # The kernel works on arrays, with -1 for an empty slot (its pages
+        # are never negative); the TLB keeps plain lists for the Python
+        # path, so copy its (empty) contents across and back
+        tlb_tags = np.full(tlb.size, -1, dtype=np.int64)
+        tlb_frames = np.array(tlb.frames, dtype=np.int32)
+        page_table = self.page_table
+        tlb_hits, tlb_misses, frames_used = replay_trace(
+            refs, writes, faults, victims, self.current_time, tlb_tags, tlb_frames,
+            page_table.valid, page_table.frame_number, page_table.referenced,
+            page_table.modified, page_table.last_access_time, page_table.access_count
+        )
+        tlb.tags[:] = [None if tag < 0 else tag for tag in tlb_tags.tolist()]
+        tlb.frames[:] = tlb_frames.tolist()
+        tlb.hits += int(tlb_hits)
+        tlb.misses += int(tlb_misses)
         
-        for i, page_number in enumerate(reference_string):
-            is_write = i in write_operations
-            self.translate_address(page_number * self.page_size, is_write)
+        self.page_faults += int(faults.sum())
+        self.memory_accesses += len(refs)
+        self.current_time += len(refs)
+        self.free_frames = deque(range(int(frames_used), self.num_frames))
+        self._last_page = int(refs[-1])
+        self._last_frame = int(page_table.frame_number[refs[-1]])
+        return True
     
     def get_statistics(self):
         """Return simulation statistics"""